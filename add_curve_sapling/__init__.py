@@ -177,15 +177,16 @@ class ImportData(Operator):
         # Make sure the operator knows about the global variables
         global settings, useSet
         # Read the preset data into the global settings
+        localDir, userDir = getPresetpaths()
         try:
-            f = open(os.path.join(getPresetpaths()[0], self.filename), 'r')
+            f = open(os.path.join(localDir, self.filename), 'r')
         except (FileNotFoundError, IOError):
-            f = open(os.path.join(getPresetpaths()[1], self.filename), 'r')
+            f = open(os.path.join(userDir, self.filename), 'r')
         # Find the first non-comment, non-blank line, this must contain preset text (all on one line).
-        for settings in f:
-            if settings and (not settings.isspace()) and (not settings.startswith("#")):
-                break
-        f.close()
+        with f:
+            for settings in f:
+                if settings and (not settings.isspace()) and (not settings.startswith("#")):
+                    break
         # print(settings)
         settings = ast.literal_eval(settings)
 
@@ -218,8 +219,9 @@ class PresetMenu(Menu):
 
     def draw(self, context):
         # Get all the sapling presets
-        presets = [a for a in os.listdir(getPresetpaths()[0]) if a[-3:] == '.py']
-        presets.extend([a for a in os.listdir(getPresetpaths()[1]) if a[-3:] == '.py'])
+        presets = []
+        for directory in getPresetpaths():
+            presets.extend([a for a in os.listdir(directory) if a[-3:] == '.py'])
         layout = self.layout
         # Append all to the menu
         for p in presets:
@@ -29,7 +29,13 @@ acadrelease = {
 }
 
 dxfversion = {
-    acad: dxf for dxf, acad in acadrelease.items()
+    'R12': 'AC1009',
+    'R13': 'AC1012',
+    'R14': 'AC1014',
+    'R2000': 'AC1015',
+    'R2004': 'AC1018',
+    'R2007': 'AC1021',
+    'R2010': 'AC1024',
 }
 
 # Entity: Polyline, Polymesh
@@ -484,16 +484,13 @@ class PolyShape(object):
 
 class PolyFace(PolyShape):
     def __init__(self, polyline):
-        VERTEX_FLAGS = const.VTX_3D_POLYFACE_MESH_VERTEX + const.VTX_3D_POLYGON_MESH_VERTEX
-
-        def is_vertex(flags):
-            return flags & VERTEX_FLAGS == VERTEX_FLAGS
+        VERTEX_FLAGS = const.VERTEX_FLAGS['polyface']
 
         super(PolyFace, self).__init__(polyline, 'POLYFACE')
         vertices = []
         face_records = []
         for vertex in polyline.vertices:
-            (vertices if is_vertex(vertex.flags) else face_records).append(vertex)
+            (vertices if vertex.flags & VERTEX_FLAGS == VERTEX_FLAGS else face_records).append(vertex)
 
         self._face_records = face_records
 
@@ -399,13 +399,28 @@ def get_node_socket(blender_material_node_tree, type, name):
     :param blender_material: a blender material for which to get the socket
     :return: a blender NodeSocket for a given type
     """
+    return get_node_sockets(blender_material_node_tree, type, (name,))[0]
+
+
+def get_node_sockets(blender_material_node_tree, type, names):
+    """
+    For several material input names, retrieve the corresponding node tree sockets for a given node type.
+    The node tree is only walked once, whatever the number of names.
+
+    :param names: the names of the sockets
+    :return: a tuple of blender NodeSocket, in the same order as names
+    """
     nodes = get_material_nodes(blender_material_node_tree, [blender_material_node_tree], type)
     #TODOSNode : Why checking outputs[0] ? What about alpha for texture node, that is outputs[1] ????
     nodes = [node for node in nodes if check_if_is_linked_to_active_output(node[0].outputs[0], node[1])]
-    inputs = sum([[(input, node[1]) for input in node[0].inputs if input.name == name] for node in nodes], [])
-    if inputs:
-        return NodeSocket(inputs[0][0], inputs[0][1])
-    return NodeSocket(None, None)
+    sockets = []
+    for name in names:
+        inputs = [(input, node[1]) for node in nodes for input in node[0].inputs if input.name == name]
+        if inputs:
+            sockets.append(NodeSocket(inputs[0][0], inputs[0][1]))
+        else:
+            sockets.append(NodeSocket(None, None))
+    return tuple(sockets)
 
 
 def get_socket(blender_material_nodetree, use_nodes: bool, name: str, volume=False):
@@ -442,6 +457,20 @@ def get_socket(blender_material_nodetree, use_nodes: bool, name: str, volume=Fal
     return NodeSocket(None, None)
 
 
+def get_sockets(blender_material_nodetree, use_nodes: bool, names):
+    """
+    For several Principled BSDF input names, retrieve the corresponding node tree sockets,
+    walking the node tree only once.
+
+    :param names: the names of the sockets
+    :return: a tuple of blender NodeSocket, in the same order as names
+    """
+    if blender_material_nodetree and use_nodes:
+        return get_node_sockets(blender_material_nodetree, bpy.types.ShaderNodeBsdfPrincipled, names)
+
+    return tuple(NodeSocket(None, None) for _ in names)
+
+
 # Old, prefer NodeNav.get_factor in new code
 def get_factor_from_socket(socket, kind):
     return socket.to_node_nav().get_factor()